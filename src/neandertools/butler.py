@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ProcessPoolExecutor
-from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timezone
+import itertools
 import multiprocessing as mp
 import os
 from typing import Any, Optional, Union
@@ -64,6 +66,7 @@ class ButlerCutoutService:
         detector: Optional[Union[int, Sequence[int]]] = None,
         pad: bool = True,
         ncores: Optional[int] = None,
+        prefetch: int = 0,
     ) -> list[Any]:
         """Return one cutout per requested ``(visit, detector)`` pair.
 
@@ -90,6 +93,10 @@ class ButlerCutoutService:
             Number of process cores used for extraction. If ``None``, choose
             ``min(cpu_count, n_items)``. If ``1``, execute serially in the
             current process. If ``>1``, use multiprocessing.
+        prefetch : int, optional
+            Number of Butler reads issued ahead of the cutout currently being
+            extracted, so that I/O latency overlaps with extraction. Requires
+            ``ncores=1``. ``0`` (default) reads one image at a time.
 
         Returns
         -------
@@ -100,11 +107,16 @@ class ButlerCutoutService:
         ------
         ValueError
             If argument combinations are invalid (for example missing paired
-            coordinates or missing ``visit``/``detector``).
+            coordinates, missing ``visit``/``detector``, or ``prefetch`` without
+            ``ncores=1``).
         """
         _validate_request(ra=ra, dec=dec, x=x, y=y, h=h, w=w, visit=visit, detector=detector)
         if ncores is not None and ncores < 1:
             raise ValueError("ncores must be >= 1")
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        if prefetch > 0 and ncores != 1:
+            raise ValueError("prefetch requires ncores=1")
         x_mode = _is_provided(x) or _is_provided(y)
         if x_mode:
             x_values = _as_list(x, "x")
@@ -138,6 +150,17 @@ class ButlerCutoutService:
 
         items = list(zip(visit_values, detector_values, x_values, y_values, ra_values, dec_values))
         workers = _resolve_ncores(ncores, len(items))
+        if workers == 1 and prefetch > 0:
+            images = get_exposures_prefetched(
+                self._butler,
+                dataset_type,
+                [_item_data_id(item) for item in items],
+                prefetch=prefetch,
+            )
+            return [
+                self._extract_cutout_item(image, item=item, h=h, w=w, pad=pad)
+                for image, item in zip(images, items)
+            ]
         if workers == 1:
             return [
                 self._run_cutout_item(dataset_type=dataset_type, item=item, h=h, w=w, pad=pad)
@@ -184,9 +207,20 @@ class ButlerCutoutService:
         pad: bool,
         butler: Optional[Any] = None,
     ) -> Any:
-        v, d, xx, yy, rr, dd = item
         read_butler = butler if butler is not None else self._butler
-        image = read_butler.get(dataset_type, dataId={"visit": int(v), "detector": int(d)})
+        image = read_butler.get(dataset_type, dataId=_item_data_id(item))
+        return self._extract_cutout_item(image, item=item, h=h, w=w, pad=pad)
+
+    def _extract_cutout_item(
+        self,
+        image: Any,
+        *,
+        item: tuple[Any, Any, Any, Any, Any, Any],
+        h: Optional[int],
+        w: Optional[int],
+        pad: bool,
+    ) -> Any:
+        _, _, xx, yy, rr, dd = item
         return self._extract_cutout(image, x=xx, y=yy, ra=rr, dec=dd, h=h, w=w, pad=pad)
 
     def find_visit_detector(
@@ -447,6 +481,62 @@ def cutouts_from_butler(
     return ButlerCutoutService(butler=butler, repo=repo, collections=collections)
 
 
+def get_exposures_prefetched(
+    butler: Any,
+    dataset_type: str,
+    data_ids: Sequence[dict[str, Any]],
+    *,
+    prefetch: int = 8,
+) -> Iterator[Any]:
+    """Yield ``butler.get(dataset_type, dataId=...)`` results in input order.
+
+    Up to ``prefetch`` reads are kept in flight on a thread pool while the
+    caller processes the current image, hiding per-read latency on remote
+    object stores. At most ``prefetch + 1`` images are held at once.
+
+    Parameters
+    ----------
+    butler : object
+        Butler-like object providing ``get(dataset_type, dataId=...)``. It
+        must tolerate concurrent reads from multiple threads.
+    dataset_type : str
+        Butler dataset type to read.
+    data_ids : sequence of dict
+        Data IDs to read, in the order results are yielded.
+    prefetch : int, optional
+        Maximum number of reads in flight.
+
+    Yields
+    ------
+    object
+        The dataset for each data ID. Read errors are raised when the
+        corresponding item is reached.
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be >= 1")
+
+    remaining = iter(data_ids)
+    ex = ThreadPoolExecutor(max_workers=prefetch)
+    try:
+        pending: deque[Any] = deque(
+            ex.submit(butler.get, dataset_type, dataId=data_id)
+            for data_id in itertools.islice(remaining, prefetch)
+        )
+        while pending:
+            image = pending.popleft().result()
+            data_id = next(remaining, None)
+            if data_id is not None:
+                pending.append(ex.submit(butler.get, dataset_type, dataId=data_id))
+            yield image
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
+
+def _item_data_id(item: tuple[Any, Any, Any, Any, Any, Any]) -> dict[str, int]:
+    v, d = item[0], item[1]
+    return {"visit": int(v), "detector": int(d)}
+
+
 def _validate_request(
     *,
     ra: Optional[Union[float, Sequence[float]]],
@@ -4,13 +4,19 @@
 
 from __future__ import annotations
 
+import functools
 import math
+import multiprocessing as mp
+import os
+import warnings
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.animation import AbstractMovieWriter
 from astropy.visualization import ZScaleInterval, ImageNormalize
 
 
@@ -34,7 +40,8 @@ def cutouts_grid(
     cmap: str = "gray",
     show: bool = True,
     auto_vlims: bool = False,
-    contrast: float = 0.1
+    contrast: float = 0.1,
+    renderer: GridRenderer | None = None,
 ):
     """Display images in a grid with linear quantile normalization.
 
@@ -87,6 +94,10 @@ def cutouts_grid(
         If ``True``, automatically adjust display limits. Overrides the qmin and qmax parameters if True.
     contrast : float, optional
         Contrast parameter for automatic display limits when ``auto_vlims=True``. This is passed to ``astropy.visualization.ZScaleInterval`` and controls the aggressiveness of the scaling; higher values result in a smaller range.
+    renderer : GridRenderer, optional
+        Existing renderer to draw into instead of creating a new figure. Its
+        layout (``ncols``, cell size, colormap, colorbars) takes precedence
+        over the corresponding arguments here.
 
     Returns
     -------
@@ -111,60 +122,190 @@ def cutouts_grid(
     if ne_indicator_scale <= 0:
         raise ValueError("ne_indicator_scale must be > 0")
 
-    nrows = math.ceil(n / ncols)
-    fig, axes = plt.subplots(
-        nrows,
-        ncols,
-        figsize=(figsize_per_cell[0] * ncols, figsize_per_cell[1] * nrows),
-        squeeze=False,
-    )
-    cmap_obj = _cmap_with_black_nan(cmap)
-
-    for i, arr in enumerate(arrays):
-        r, c = divmod(i, ncols)
-        ax = axes[r][c]
-
-        im = ax.imshow(
-            arr,
-            origin="lower",
-            vmin=vmins[i],
-            vmax=vmaxs[i],
-            cmap=cmap_obj,
-            interpolation="nearest",
-            extent=extents[i],
+    if renderer is None:
+        renderer = GridRenderer(
+            n,
+            ncols=ncols,
+            figsize_per_cell=figsize_per_cell,
+            cmap=cmap,
+            add_colorbar=add_colorbar,
         )
+    renderer.update(
+        arrays,
+        vmins,
+        vmaxs,
+        extents,
+        titles=titles,
+        ne_vectors=ne_vectors if show_ne_indicator else None,
+        ne_indicator_scale=ne_indicator_scale,
+        warp_common_grid=warp_common_grid,
+    )
+    if show:
+        plt.show()
 
-        ax.set_aspect("equal")
-        ax.set_xlabel("Delta x (arcsec)")
-        if c == 0:
-            ax.set_ylabel("Delta y (arcsec)")
+    return renderer.fig, renderer.axes
 
-        if titles is not None:
-            ax.set_title(titles[i], fontsize=10)
 
-        if add_colorbar:
-            fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+class GridRenderer:
+    """Reusable matplotlib figure for showing batches of cutouts in a grid.
 
-        if warp_common_grid:
-            # _warp_to_common_radec_grid edited to have RA increase to the left
-            # N/E vectors calculated from the actual WCS
-            ax.set_xlabel("Delta R.A. (arcsec)")
-            ax.invert_xaxis()  # East to the left.
-            if c == 0:
-                ax.set_ylabel("Delta Dec. (arcsec)")
+    The figure, its axes and one ``AxesImage`` per cell are created once.
+    Subsequent ``update`` calls only replace pixel data, display limits and
+    extents (``set_data``/``set_clim``/``set_extent``), which avoids
+    rebuilding the figure when browsing several batches in a notebook. The
+    layout is recomputed only when titles, axis ranges or labels change.
 
-        if show_ne_indicator:
-            _draw_ne_indicator(ax, ne_vectors[i], scale_frac=ne_indicator_scale)
+    Parameters
+    ----------
+    n : int
+        Number of grid cells.
+    ncols : int, optional
+        Number of columns in the grid.
+    figsize_per_cell : tuple of float, optional
+        Width and height per subplot cell.
+    cmap : str, optional
+        Matplotlib colormap name.
+    add_colorbar : bool, optional
+        If ``True``, draw one colorbar per subplot.
+    """
 
-    for j in range(n, nrows * ncols):
-        r, c = divmod(j, ncols)
-        axes[r][c].axis("off")
+    def __init__(
+        self,
+        n: int,
+        ncols: int = 5,
+        figsize_per_cell: tuple[float, float] = (3.2, 3.2),
+        cmap: str = "gray",
+        add_colorbar: bool = False,
+    ) -> None:
+        if n < 1:
+            raise ValueError("n must be >= 1")
+        self.n = n
+        self.ncols = ncols
+        self.add_colorbar = add_colorbar
+        nrows = math.ceil(n / ncols)
+        self.fig, self.axes = plt.subplots(
+            nrows,
+            ncols,
+            figsize=(figsize_per_cell[0] * ncols, figsize_per_cell[1] * nrows),
+            squeeze=False,
+        )
+        self.ims: list[Any] = []
+        self._cmap = _cmap_with_black_nan(cmap)
+        self._ne_artists: list[list[Any]] = [[] for _ in range(n)]
+        self._warp_labels: bool | None = None
+        self._has_titles = False
+        self._layout_key: tuple[Any, ...] | None = None
+
+        # Only the used cells get an equal aspect; the hidden trailing cells
+        # keep the default so tight_layout places the grid as before.
+        for j in range(nrows * ncols):
+            r, c = divmod(j, ncols)
+            if j < n:
+                self.axes[r][c].set_aspect("equal")
+            else:
+                self.axes[r][c].axis("off")
+
+    def update(
+        self,
+        arrays: Sequence[np.ndarray],
+        vmins: Sequence[float],
+        vmaxs: Sequence[float],
+        extents: Sequence[tuple[float, float, float, float]],
+        *,
+        titles: Sequence[str] | None = None,
+        ne_vectors: Sequence[tuple[np.ndarray, np.ndarray] | None] | None = None,
+        ne_indicator_scale: float = 0.10,
+        warp_common_grid: bool = False,
+    ) -> None:
+        """Draw a batch of prepared cutouts, reusing the existing images.
+
+        ``ne_vectors`` enables the North/East indicator when provided.
+        """
+        if len(arrays) != self.n:
+            raise ValueError(f"GridRenderer was created for {self.n} cells, got {len(arrays)} images")
+        first_draw = not self.ims
 
-    fig.tight_layout()
-    if show:
-        plt.show()
+        for i, arr in enumerate(arrays):
+            r, c = divmod(i, self.ncols)
+            ax = self.axes[r][c]
+
+            if first_draw:
+                im = ax.imshow(
+                    arr,
+                    origin="lower",
+                    vmin=vmins[i],
+                    vmax=vmaxs[i],
+                    cmap=self._cmap,
+                    interpolation="nearest",
+                    extent=extents[i],
+                )
+                self.ims.append(im)
+                if self.add_colorbar:
+                    self.fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+            else:
+                im = self.ims[i]
+                im.set_data(arr)
+                im.set_clim(vmins[i], vmaxs[i])
+                im.set_extent(extents[i])
+                ax.set_xlim(extents[i][0], extents[i][1])
+                ax.set_ylim(extents[i][2], extents[i][3])
+
+            if warp_common_grid:
+                # _warp_to_common_radec_grid edited to have RA increase to the left
+                # N/E vectors calculated from the actual WCS
+                ax.invert_xaxis()  # East to the left.
+
+            for artist in self._ne_artists[i]:
+                artist.remove()
+            self._ne_artists[i] = []
+            if ne_vectors is not None:
+                self._ne_artists[i] = _draw_ne_indicator(ax, ne_vectors[i], scale_frac=ne_indicator_scale)
+
+        # Axis labels only change with the projection; don't touch them otherwise.
+        if warp_common_grid != self._warp_labels:
+            xlabel, ylabel = (
+                ("Delta R.A. (arcsec)", "Delta Dec. (arcsec)")
+                if warp_common_grid
+                else ("Delta x (arcsec)", "Delta y (arcsec)")
+            )
+            for i in range(self.n):
+                r, c = divmod(i, self.ncols)
+                self.axes[r][c].set_xlabel(xlabel)
+                if c == 0:
+                    self.axes[r][c].set_ylabel(ylabel)
+            self._warp_labels = warp_common_grid
 
-    return fig, axes
+        if titles is not None:
+            # Extra titles are ignored; cells past the end of a short list are
+            # cleared rather than keeping an earlier batch's title.
+            titles = list(titles)
+            for i in range(self.n):
+                r, c = divmod(i, self.ncols)
+                self.axes[r][c].set_title(titles[i] if i < len(titles) else "", fontsize=10)
+        elif self._has_titles:
+            # Don't leave the previous batch's titles on untitled cells.
+            for i in range(self.n):
+                r, c = divmod(i, self.ncols)
+                self.axes[r][c].set_title("")
+        self._has_titles = titles is not None
+
+        # tight_layout depends on the titles, the tick labels (extents, and the
+        # color limits when colorbars are drawn) and the axis labels; redo it
+        # only when one of them changed, so a reused grid matches a fresh one.
+        layout_key = (
+            None if titles is None else tuple(str(t) for t in titles[: self.n]),
+            tuple(tuple(extent) for extent in extents),
+            (tuple(vmins), tuple(vmaxs)) if self.add_colorbar else None,
+            warp_common_grid,
+        )
+        if layout_key != self._layout_key:
+            # tight_layout starts from the current subplot parameters; reset
+            # them so the result matches a first layout.
+            params = ("left", "bottom", "right", "top", "wspace", "hspace")
+            self.fig.subplots_adjust(**{k: plt.rcParams[f"figure.subplot.{k}"] for k in params})
+            self.fig.tight_layout()
+            self._layout_key = layout_key
+        self.fig.canvas.draw_idle()
 
 
 def cutouts_gif(
@@ -197,6 +338,10 @@ def cutouts_gif(
     frame of the output GIF. When ``titles`` is omitted, metadata-derived
     two-line titles are used.
 
+    GIF frames are palette-quantized and LZW-encoded in Python, which gets slow
+    and large for long sequences; ``cutouts_mp4`` renders the same frames to an
+    H.264 movie through ffmpeg and is usually much smaller and faster to write.
+
     Returns
     -------
     pathlib.Path
@@ -209,6 +354,136 @@ def cutouts_gif(
     if title_fontsize <= 0:
         raise ValueError("title_fontsize must be > 0")
 
+    fps = 1000.0 / float(frame_duration_ms)
+    return _write_cutout_animation(
+        _StreamingGifWriter(fps=fps),
+        images=images,
+        output_path=output_path,
+        titles=titles,
+        figsize=figsize,
+        qmin=qmin,
+        qmax=qmax,
+        match_background=match_background,
+        match_noise=match_noise,
+        sigma_clip=sigma_clip,
+        sigma_clip_iters=sigma_clip_iters,
+        warp_common_grid=warp_common_grid,
+        warp_shape=warp_shape,
+        warp_pixel_scale_arcsec=warp_pixel_scale_arcsec,
+        show_ne_indicator=show_ne_indicator,
+        ne_indicator_scale=ne_indicator_scale,
+        cmap=cmap,
+        dpi=dpi,
+        title_fontsize=title_fontsize,
+        show=show,
+        auto_vlims=auto_vlims,
+        contrast=contrast,
+    )
+
+
+def cutouts_mp4(
+    images: Sequence[Any],
+    output_path: str | Path = "cutouts.mp4",
+    titles: Sequence[str] | None = None,
+    figsize: tuple[float, float] = (5.0, 5.0),
+    qmin: float = 0.0,
+    qmax: float = 0.99,
+    match_background: bool = True,
+    match_noise: bool = False,
+    sigma_clip: float = 3.0,
+    sigma_clip_iters: int = 5,
+    warp_common_grid: bool = False,
+    warp_shape: tuple[int, int] | None = None,
+    warp_pixel_scale_arcsec: float | None = None,
+    show_ne_indicator: bool = False,
+    ne_indicator_scale: float = 0.10,
+    cmap: str = "gray",
+    fps: float = 10.0,
+    dpi: int = 100,
+    title_fontsize: float = 12.0,
+    show: bool = False,
+    auto_vlims: bool = False,
+    contrast: float = 0.1,
+    bitrate: int | None = None,
+) -> Path:
+    """Save cutouts as an H.264 MP4 movie.
+
+    Frames are rendered exactly as in ``cutouts_gif`` but piped to ``ffmpeg``
+    for encoding, which is much faster and produces much smaller files than
+    GIF for long sequences. Requires an ``ffmpeg`` executable on ``PATH`` (or
+    configured via ``matplotlib.rcParams["animation.ffmpeg_path"]``).
+
+    Parameters are analogous to ``cutouts_gif``, with ``fps`` (frames per
+    second) in place of ``frame_duration_ms``. ``bitrate`` is in kbit/s; by
+    default ffmpeg chooses it.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the created MP4 file.
+    """
+    from matplotlib.animation import FFMpegWriter
+
+    if fps <= 0:
+        raise ValueError("fps must be > 0")
+    if dpi <= 0:
+        raise ValueError("dpi must be > 0")
+    if title_fontsize <= 0:
+        raise ValueError("title_fontsize must be > 0")
+    if not FFMpegWriter.isAvailable():
+        raise RuntimeError("cutouts_mp4 requires ffmpeg; install it or use cutouts_gif instead")
+
+    return _write_cutout_animation(
+        FFMpegWriter(fps=fps, codec="h264", bitrate=bitrate),
+        images=images,
+        output_path=output_path,
+        titles=titles,
+        figsize=figsize,
+        qmin=qmin,
+        qmax=qmax,
+        match_background=match_background,
+        match_noise=match_noise,
+        sigma_clip=sigma_clip,
+        sigma_clip_iters=sigma_clip_iters,
+        warp_common_grid=warp_common_grid,
+        warp_shape=warp_shape,
+        warp_pixel_scale_arcsec=warp_pixel_scale_arcsec,
+        show_ne_indicator=show_ne_indicator,
+        ne_indicator_scale=ne_indicator_scale,
+        cmap=cmap,
+        dpi=dpi,
+        title_fontsize=title_fontsize,
+        show=show,
+        auto_vlims=auto_vlims,
+        contrast=contrast,
+    )
+
+
+def _write_cutout_animation(
+    writer: AbstractMovieWriter,
+    images: Sequence[Any],
+    output_path: str | Path,
+    titles: Sequence[str] | None,
+    figsize: tuple[float, float],
+    qmin: float,
+    qmax: float,
+    match_background: bool,
+    match_noise: bool,
+    sigma_clip: float,
+    sigma_clip_iters: int,
+    warp_common_grid: bool,
+    warp_shape: tuple[int, int] | None,
+    warp_pixel_scale_arcsec: float | None,
+    show_ne_indicator: bool,
+    ne_indicator_scale: float,
+    cmap: str,
+    dpi: int,
+    title_fontsize: float,
+    show: bool,
+    auto_vlims: bool,
+    contrast: float,
+) -> Path:
+    """Render one figure frame per cutout into a matplotlib movie ``writer``."""
     arrays, vmins, vmaxs, extents, ne_vectors = _prepare_cutouts_for_display(
         images=images,
         qmin=qmin,
@@ -226,8 +501,6 @@ def cutouts_gif(
     if ne_indicator_scale <= 0:
         raise ValueError("ne_indicator_scale must be > 0")
 
-    from matplotlib.animation import PillowWriter
-
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     fig, ax = plt.subplots(1, 1, figsize=figsize, squeeze=True)
@@ -258,8 +531,6 @@ def cutouts_gif(
         auto_titles = [str(t) for t in titles]
 
     frame_title = ax.set_title("", fontsize=title_fontsize)
-    fps = 1000.0 / float(frame_duration_ms)
-    writer = PillowWriter(fps=fps)
     with writer.saving(fig, str(output_path), dpi=dpi):
         for i, arr in enumerate(arrays):
             im.set_data(arr)
@@ -288,6 +559,440 @@ def cutouts_gif(
     return output_path
 
 
+def arrays_to_gif(
+    images: Sequence[Any],
+    output_path: str | Path = "cutouts.gif",
+    vmin: float | None = None,
+    vmax: float | None = None,
+    frame_duration_ms: int = 300,
+    contrast: float = 0.1,
+) -> Path:
+    """Save same-shape cutouts as a grayscale animated GIF without matplotlib.
+
+    Each frame is scaled to 8 bits in NumPy and streamed straight to the GIF
+    encoder, skipping the figure render used by ``cutouts_gif``. No axes,
+    titles or background matching are applied.
+
+    Parameters
+    ----------
+    images : sequence
+        Image-like objects (see ``cutouts_grid``) or 2D arrays, all with the
+        same shape.
+    output_path : str or Path
+        Output GIF file path.
+    vmin, vmax : float, optional
+        Display limits shared by all frames. If either is omitted, limits are
+        determined with ``astropy.visualization.ZScaleInterval`` over all
+        finite pixels.
+    frame_duration_ms : int, optional
+        Duration of each frame in milliseconds.
+    contrast : float, optional
+        ``ZScaleInterval`` contrast used when ``vmin``/``vmax`` are omitted.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the created GIF file.
+    """
+    if frame_duration_ms <= 0:
+        raise ValueError("frame_duration_ms must be > 0")
+    arrays = [_extract_image_array(obj) for obj in images]
+    if not arrays:
+        raise ValueError("No images provided.")
+    if len({arr.shape for arr in arrays}) != 1 or arrays[0].ndim != 2:
+        raise ValueError("arrays_to_gif requires 2D images of identical shape.")
+    if vmin is None or vmax is None:
+        z_vmin, z_vmax = _shared_zscale_limits(arrays, contrast)
+        vmin = z_vmin if vmin is None else vmin
+        vmax = z_vmax if vmax is None else vmax
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with _GifStream(output_path, duration_ms=frame_duration_ms) as gif:
+        for arr in arrays:
+            gif.append(_gray_image(_scale_to_uint8(arr[::-1], float(vmin), float(vmax))))
+    return output_path
+
+
+def cutout_to_png(
+    image: Any,
+    output_path: str | Path,
+    vmin: float | None = None,
+    vmax: float | None = None,
+    title: str | None = None,
+    contrast: float = 0.1,
+) -> Path:
+    """Save a single cutout as an 8-bit grayscale PNG.
+
+    The pixel data are scaled to ``uint8`` in NumPy and encoded directly with
+    Pillow, so no matplotlib figure is created. This is much cheaper than
+    rendering through ``cutouts_gif``/``cutouts_grid`` when many frames are
+    written.
+
+    Parameters
+    ----------
+    image : object
+        Image-like object (see ``cutouts_grid``) or a 2D array.
+    output_path : str or Path
+        Output PNG file path.
+    vmin, vmax : float, optional
+        Display limits. If either is omitted, limits are determined with
+        ``astropy.visualization.ZScaleInterval``.
+    title : str, optional
+        Text drawn in a white strip above the image.
+    contrast : float, optional
+        ``ZScaleInterval`` contrast used when ``vmin``/``vmax`` are omitted.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the created PNG file.
+    """
+    arr = _extract_image_array(image)
+    if arr.ndim != 2:
+        raise ValueError("cutout_to_png requires a 2D image.")
+    return PngRenderer(arr.shape).render(
+        arr, output_path, vmin=vmin, vmax=vmax, title=title, contrast=contrast
+    )
+
+
+class PngRenderer:
+    """Write same-shape cutouts to PNG files, reusing buffers across calls.
+
+    ``cutout_to_png`` sets up a float32 scratch array and an 8-bit image for
+    every call. When many frames of one shape are written, a renderer keeps
+    both (the PIL image shares memory with the 8-bit buffer), so each frame
+    only costs the scaling pass and the PNG encode.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        ``(height, width)`` of the cutouts to render.
+    """
+
+    def __init__(self, shape: tuple[int, int]) -> None:
+        if len(shape) != 2 or shape[0] <= 0 or shape[1] <= 0:
+            raise ValueError("shape must be a (height, width) tuple of positive ints")
+        self.shape = (int(shape[0]), int(shape[1]))
+        self._scratch = np.empty(self.shape, dtype=np.float32)
+        self._u8 = np.empty(self.shape, dtype=np.uint8)
+        self._image = _gray_image(self._u8)
+
+    def render(
+        self,
+        image: Any,
+        output_path: str | Path,
+        vmin: float | None = None,
+        vmax: float | None = None,
+        title: str | None = None,
+        contrast: float = 0.1,
+    ) -> Path:
+        """Write one cutout; arguments are as for ``cutout_to_png``."""
+        arr = _extract_image_array(image)
+        if arr.shape != self.shape:
+            raise ValueError(f"PngRenderer expects shape {self.shape}, got {arr.shape}")
+        if vmin is None or vmax is None:
+            z_vmin, z_vmax = _zscale_limits(arr, contrast=contrast)
+            vmin = z_vmin if vmin is None else vmin
+            vmax = z_vmax if vmax is None else vmax
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Row 0 is the bottom of the image (origin="lower"), but the top of a PNG.
+        _scale_to_uint8(arr[::-1], float(vmin), float(vmax), scratch=self._scratch, out=self._u8)
+        img = self._image
+        if title:
+            img = _add_title_strip(img, str(title))
+        img.save(output_path, format="PNG", optimize=False, compress_level=1)
+        return output_path
+
+
+def render_png_batch(
+    images: Sequence[Any],
+    output_dir: str | Path,
+    vmin: float | None = None,
+    vmax: float | None = None,
+    titles: Sequence[str] | None = None,
+    contrast: float = 0.1,
+    ncores: int | None = None,
+) -> list[Path]:
+    """Write each cutout to ``output_dir/cutout_NNNN.png`` using worker processes.
+
+    Frames are rendered with ``cutout_to_png``. Only the pixel arrays, limits
+    and output paths are sent to the workers, never the source image objects.
+
+    Parameters
+    ----------
+    images : sequence
+        Image-like objects (see ``cutouts_grid``) or 2D arrays.
+    output_dir : str or Path
+        Directory for the PNG files; created if missing.
+    vmin, vmax : float, optional
+        Display limits shared by all frames. If either is omitted, limits are
+        determined with ``astropy.visualization.ZScaleInterval`` over all
+        finite pixels, so that the frames share one scale.
+    titles : sequence of str, optional
+        Optional per-image titles.
+    contrast : float, optional
+        ``ZScaleInterval`` contrast used when ``vmin``/``vmax`` are omitted.
+    ncores : int, optional
+        Number of worker processes. If ``None``, choose
+        ``min(cpu_count, n_images)``. If ``1``, render serially in the current
+        process.
+
+    Returns
+    -------
+    list of pathlib.Path
+        Paths of the written PNG files, in input order.
+    """
+    if ncores is not None and ncores < 1:
+        raise ValueError("ncores must be >= 1")
+    arrays = [_extract_image_array(obj) for obj in images]
+    if not arrays:
+        raise ValueError("No images provided.")
+    if titles is not None and len(titles) != len(arrays):
+        raise ValueError("titles must have the same length as images")
+    if vmin is None or vmax is None:
+        z_vmin, z_vmax = _shared_zscale_limits(arrays, contrast)
+        vmin = z_vmin if vmin is None else vmin
+        vmax = z_vmax if vmax is None else vmax
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [
+        (
+            arr,
+            output_dir / f"cutout_{i:04d}.png",
+            float(vmin),
+            float(vmax),
+            None if titles is None else titles[i],
+        )
+        for i, arr in enumerate(arrays)
+    ]
+
+    workers = ncores if ncores is not None else max(1, min(os.cpu_count() or 1, len(tasks)))
+    if workers == 1:
+        return _render_png_tasks(tasks)
+    try:
+        process_ctx = mp.get_context("fork")
+    except ValueError as e:
+        raise ValueError("multiprocessing with fork is not supported on this platform.") from e
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=process_ctx,
+            initializer=_init_png_batch_worker,
+        ) as ex:
+            return list(ex.map(_png_batch_worker, tasks, chunksize=max(1, len(tasks) // (4 * workers))))
+    except (PermissionError, NotImplementedError):
+        # Restricted environments may block process primitives.
+        return _render_png_tasks(tasks)
+
+
+# Per-worker renderer cache, set up by ``_init_png_batch_worker`` in pool
+# workers only; serial rendering uses a local cache instead, so threads in the
+# parent process never share buffers.
+_PNG_BATCH_RENDERERS: dict[tuple[int, ...], PngRenderer] | None = None
+
+
+def _init_png_batch_worker() -> None:
+    global _PNG_BATCH_RENDERERS
+    # Pay the Pillow import and font load once per worker, not once per frame.
+    from PIL import Image  # noqa: F401
+
+    _default_font()
+    _PNG_BATCH_RENDERERS = {}
+
+
+def _png_batch_worker(task: tuple[np.ndarray, Path, float, float, str | None]) -> Path:
+    if _PNG_BATCH_RENDERERS is None:
+        raise RuntimeError("PNG batch worker not initialized")
+    return _render_png_task(task, _PNG_BATCH_RENDERERS)
+
+
+def _render_png_tasks(tasks: Sequence[tuple[np.ndarray, Path, float, float, str | None]]) -> list[Path]:
+    renderers: dict[tuple[int, ...], PngRenderer] = {}
+    return [_render_png_task(task, renderers) for task in tasks]
+
+
+def _render_png_task(
+    task: tuple[np.ndarray, Path, float, float, str | None],
+    renderers: dict[tuple[int, ...], PngRenderer],
+) -> Path:
+    arr, path, vmin, vmax, title = task
+    renderer = renderers.get(arr.shape)
+    if renderer is None:
+        renderer = renderers[arr.shape] = PngRenderer(arr.shape)
+    return renderer.render(arr, path, vmin=vmin, vmax=vmax, title=title)
+
+
+def _shared_zscale_limits(arrays: Sequence[np.ndarray], contrast: float) -> tuple[float, float]:
+    return _zscale_limits(_stack_or_concatenate(arrays), contrast=contrast)
+
+
+def _scale_to_uint8(
+    arr: np.ndarray,
+    vmin: float,
+    vmax: float,
+    scratch: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Linearly map ``[vmin, vmax]`` to ``[0, 255]``; non-finite pixels map to 0.
+
+    ``scratch`` (float32) and ``out`` (uint8) are optional preallocated buffers.
+    """
+    if not vmax > vmin:
+        vmax = vmin + 1e-12
+    scaled = np.subtract(arr, vmin, out=scratch, dtype=np.float32)
+    scaled *= np.float32(255.0 / (vmax - vmin))
+    np.nan_to_num(scaled, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    np.clip(scaled, 0.0, 255.0, out=scaled)
+    if out is None:
+        return scaled.astype(np.uint8)
+    np.copyto(out, scaled, casting="unsafe")
+    return out
+
+
+def _gray_image(u8: np.ndarray) -> Any:
+    """Wrap a 2D ``uint8`` array as a PIL "L" image, sharing its memory.
+
+    Only a non-C-contiguous array (e.g. scaled from a transposed cutout) is
+    copied first.
+    """
+    from PIL import Image
+
+    u8 = np.ascontiguousarray(u8)
+    h, w = u8.shape
+    return Image.frombuffer("L", (w, h), u8, "raw", "L", 0, 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_font() -> Any:
+    from PIL import ImageFont
+
+    return ImageFont.load_default()
+
+
+def _add_title_strip(img: Any, title: str) -> Any:
+    from PIL import Image, ImageDraw
+
+    font = _default_font()
+    # Measure on a throwaway canvas: drawing on ``img`` itself would make Pillow
+    # detach it from a shared (frombuffer) pixel buffer.
+    left, top, right, bottom = ImageDraw.Draw(Image.new("L", (1, 1))).multiline_textbbox(
+        (0, 0), title, font=font
+    )
+    pad = 2
+    strip_h = int(bottom - top) + 2 * pad
+    out = Image.new("L", (img.width, img.height + strip_h), color=255)
+    out.paste(img, (0, strip_h))
+    x = max(0, (img.width - int(right - left)) // 2)
+    ImageDraw.Draw(out).multiline_text((x, pad - top), title, fill=0, font=font, align="center")
+    return out
+
+
+class _GifStream:
+    """Append frames to a GIF file one at a time.
+
+    ``PIL.Image.save(..., append_images=...)`` (and matplotlib's
+    ``PillowWriter``) keep every frame in memory until the file is written;
+    here each frame is encoded and written as soon as it is appended, so
+    memory use does not grow with the number of frames.
+
+    Frames without color are written as "L" images against an exact
+    256-level gray table, with no quantization. Color frames are quantized to a 256-color palette derived from the
+    first such frame and reused for all later ones; this avoids per-frame
+    palette generation and color flicker. A frame whose palette differs from
+    the GIF's global color table carries its own local table.
+    """
+
+    def __init__(self, path: str | Path, duration_ms: int, loop: int = 0) -> None:
+        self._fp = open(path, "wb")
+        self._duration_ms = int(duration_ms)
+        self._loop = loop
+        self._n_frames = 0
+        self._master_palette: Any = None
+        self._global_table: str | None = None
+
+    def append(self, frame: Any) -> None:
+        from PIL import GifImagePlugin, Image
+
+        if frame.mode == "P":
+            table = "own"
+        elif frame.mode == "L":
+            table = "gray"
+        else:
+            frame = frame.convert("RGB")
+            rgb = np.asarray(frame)
+            if np.array_equal(rgb[..., 0], rgb[..., 1]) and np.array_equal(rgb[..., 1], rgb[..., 2]):
+                frame = frame.convert("L")
+                table = "gray"
+            elif self._master_palette is None:
+                frame = frame.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+                self._master_palette = frame
+                table = "master"
+            else:
+                frame = frame.quantize(palette=self._master_palette, dither=Image.Dither.NONE)
+                table = "master"
+        if self._n_frames == 0:
+            header, _ = GifImagePlugin.getheader(frame, info={"loop": self._loop})
+            for chunk in header:
+                self._fp.write(chunk)
+            self._global_table = table
+            params: dict[str, Any] = {}
+        else:
+            local = table == "own" or table != self._global_table
+            if local and frame.mode == "L":
+                # Give the frame an explicit gray palette to write as its local table.
+                frame = frame.copy()
+                frame.putpalette(bytes(i // 3 for i in range(768)))
+            params = {"include_color_table": local}
+        for chunk in GifImagePlugin.getdata(frame, duration=self._duration_ms, **params):
+            self._fp.write(chunk)
+        self._n_frames += 1
+
+    def close(self) -> None:
+        if not self._fp.closed:
+            self._fp.write(b";")  # GIF trailer
+            self._fp.close()
+
+    def __enter__(self) -> "_GifStream":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class _StreamingGifWriter(AbstractMovieWriter):
+    """Matplotlib movie writer that streams frames into a ``_GifStream``."""
+
+    def setup(self, fig: Any, outfile: str | Path, dpi: float | None = None) -> None:
+        super().setup(fig, outfile, dpi=dpi)
+        self._gif = _GifStream(self.outfile, duration_ms=int(1000 / self.fps))
+
+    def grab_frame(self, **savefig_kwargs: Any) -> None:
+        from io import BytesIO
+
+        from PIL import Image
+
+        if not savefig_kwargs and self.dpi == self.fig.dpi and hasattr(self.fig.canvas, "buffer_rgba"):
+            # Read the Agg canvas directly instead of re-rendering via savefig;
+            # other canvases (e.g. Cairo, SVG) go through savefig below.
+            self.fig.canvas.draw()
+            rgba = self.fig.canvas.buffer_rgba()
+            size = (rgba.shape[1], rgba.shape[0])
+        else:
+            buf = BytesIO()
+            self.fig.savefig(buf, **{**savefig_kwargs, "format": "rgba", "dpi": self.dpi})
+            rgba = buf.getbuffer()
+            size = self.frame_size
+        self._gif.append(Image.frombuffer("RGBA", size, rgba, "raw", "RGBA", 0, 1))
+
+    def finish(self) -> None:
+        self._gif.close()
+
+
 def _prepare_cutouts_for_display(
     *,
     images: Sequence[Any],
@@ -362,81 +1067,214 @@ def _prepare_cutouts_for_display(
             ne_vectors.append(ne_i)
 
     proc_arrays = []
-    for arr in arrays:
-        if match_background or match_noise:
-            bg, rms = _sigma_clipped_bg_rms(arr, sigma=sigma_clip, maxiters=sigma_clip_iters)
-            arr_proc = arr.astype(np.float32, copy=True)
+    stack = None
+    if match_background or match_noise:
+        bg_rms = _sigma_clipped_bg_rms_many(arrays, sigma=sigma_clip, maxiters=sigma_clip_iters)
+        if len({arr.shape for arr in arrays}) == 1:
+            # Same-shape cutouts: normalize one contiguous (N, H, W) float32
+            # stack in place with broadcast per-frame bg/rms, and hand out
+            # per-frame views of it.
+            stack = np.empty((n, *arrays[0].shape), dtype=np.float32)
+            np.stack(arrays, out=stack)
             if match_background:
-                arr_proc = arr_proc - bg
+                stack -= np.array([bg for bg, _ in bg_rms], dtype=np.float32)[:, None, None]
             if match_noise:
-                arr_proc = arr_proc / max(rms, 1e-12)
-            proc_arrays.append(arr_proc)
+                stack /= np.array([max(rms, 1e-12) for _, rms in bg_rms], dtype=np.float32)[:, None, None]
+            proc_arrays = list(stack)
         else:
-            proc_arrays.append(arr)
+            for arr, (bg, rms) in zip(arrays, bg_rms):
+                # No up-front copy: the first arithmetic step below allocates the
+                # output, so the caller's array is never modified.
+                arr_proc = np.asarray(arr, dtype=np.float32)
+                if match_background:
+                    arr_proc = arr_proc - bg
+                if match_noise:
+                    if match_background:
+                        arr_proc /= max(rms, 1e-12)
+                    else:
+                        arr_proc = arr_proc / max(rms, 1e-12)
+                proc_arrays.append(arr_proc)
+    else:
+        proc_arrays = list(arrays)
 
     shared_scale = match_background or match_noise
     vmins = []
     vmaxs = []
     if shared_scale:
-        finite_parts = [arr[np.isfinite(arr)] for arr in proc_arrays if np.any(np.isfinite(arr))]
-        if not finite_parts:
+        # ZScaleInterval drops non-finite pixels itself; nanquantile only skips
+        # NaN, so +/-inf pixels are masked to NaN for the quantile branch.
+        all_values = stack if stack is not None else _stack_or_concatenate(proc_arrays)
+        if all_values.size == 0:
             raise ValueError("No finite pixels available to determine display scale.")
-        all_values = np.concatenate(finite_parts)
-        
+
         if auto_vlims:
-            norm = ZScaleInterval(contrast=contrast, krej=3).get_limits(all_values)
+            norm = _zscale_limits(all_values, contrast=contrast, krej=3)
             vmins = [norm[0]] * n
             vmaxs = [norm[1]] * n
         else:
-            shared_vmin = float(np.quantile(all_values, qmin))
-            shared_vmax = float(np.quantile(all_values, qmax))
+            finite = np.isfinite(all_values)
+            if not finite.all():
+                # Masked copy; proc_arrays may be views of ``all_values``.
+                all_values = np.where(finite, all_values, np.nan)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN input
+                shared_vmin, shared_vmax = (float(v) for v in np.nanquantile(all_values, [qmin, qmax]))
+            if not np.isfinite(shared_vmin):
+                raise ValueError("No finite pixels available to determine display scale.")
             if shared_vmax <= shared_vmin:
                 shared_vmax = shared_vmin + 1e-12
             vmins = [shared_vmin] * n
             vmaxs = [shared_vmax] * n
         
     else:
-        for arr in proc_arrays:
-            vmin = float(np.nanquantile(arr, qmin))
-            vmax = float(np.nanquantile(arr, qmax))
-            if vmax <= vmin:
-                vmax = vmin + 1e-12
-            vmins.append(vmin)
-            vmaxs.append(vmax)
+        vmins, vmaxs = _compute_limits_batch(proc_arrays, qmin, qmax)
 
     print(vmins, vmaxs)
 
     return proc_arrays, vmins, vmaxs, extents, ne_vectors
 
 
-def _sigma_clipped_bg_rms(arr: np.ndarray, sigma: float, maxiters: int) -> tuple[float, float]:
-    values = np.asarray(arr, dtype=np.float64)
-    values = values[np.isfinite(values)]
-    if values.size == 0:
-        return 0.0, 1.0
+def _compute_limits_batch(
+    arrays: Sequence[np.ndarray], qmin: float, qmax: float
+) -> tuple[list[float], list[float]]:
+    """Per-array ``(vmin, vmax)`` quantile limits, batched when shapes match."""
+    if len({arr.shape for arr in arrays}) == 1:
+        stack = np.stack(arrays).reshape(len(arrays), -1)
+        if np.isnan(stack).any():
+            # nanquantile falls back to a per-row loop along an axis.
+            lims = np.nanquantile(stack, [qmin, qmax], axis=1)
+        else:
+            lims = np.quantile(stack, [qmin, qmax], axis=1)
+    else:
+        lims = np.array([np.nanquantile(arr, [qmin, qmax]) for arr in arrays]).T
+
+    vmins: list[float] = []
+    vmaxs: list[float] = []
+    for vmin, vmax in zip(lims[0].tolist(), lims[1].tolist()):
+        if vmax <= vmin:
+            vmax = vmin + 1e-12
+        vmins.append(vmin)
+        vmaxs.append(vmax)
+    return vmins, vmaxs
+
+
+def _stack_or_concatenate(arrays: Sequence[np.ndarray]) -> np.ndarray:
+    """All pixels of ``arrays`` in one array: an (N, H, W) stack if shapes match.
+
+    Non-finite pixels are kept; callers must mask them where they matter.
+    """
+    if len({arr.shape for arr in arrays}) == 1:
+        return np.stack(arrays)
+    return np.concatenate([arr.ravel() for arr in arrays])
+
+
+def _zscale_limits(values: np.ndarray, **kwargs: Any) -> tuple[float, float]:
+    """``ZScaleInterval`` limits of ``values``; non-finite pixels are ignored."""
+    try:
+        vmin, vmax = ZScaleInterval(**kwargs).get_limits(values)
+    except IndexError:  # nothing left to sample after dropping non-finite pixels
+        raise ValueError("No finite pixels available to determine display scale.") from None
+    return float(vmin), float(vmax)
 
-    clipped = values
+
+def _sigma_clipped_bg_rms_many(
+    arrays: Sequence[np.ndarray], sigma: float, maxiters: int
+) -> list[tuple[float, float]]:
+    """Run ``_sigma_clipped_bg_rms`` on each array, in a thread pool if useful.
+
+    The per-array work is dominated by NumPy partition/abs/compare passes,
+    which release the GIL, so threads scale without pickling the arrays.
+    """
+    workers = max(1, min(os.cpu_count() or 1, len(arrays)))
+    if workers == 1:
+        return [_sigma_clipped_bg_rms(arr, sigma=sigma, maxiters=maxiters) for arr in arrays]
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(lambda arr: _sigma_clipped_bg_rms(arr, sigma=sigma, maxiters=maxiters), arrays))
+
+
+def _sigma_clipped_bg_rms(
+    arr: np.ndarray, sigma: float, maxiters: int, dtype: Any = None
+) -> tuple[float, float]:
+    # Work in the input precision (at least float32) unless ``dtype`` asks
+    # otherwise: float32 halves the bytes moved by every median/abs/compare pass.
+    arr = np.asarray(arr)
+    if dtype is None:
+        dtype = np.promote_types(arr.dtype, np.float32)
+
+    # Sort once: every clipping iteration keeps a contiguous window s[lo:hi]
+    # of the sorted values, so the median and MAD are index lookups and the
+    # clip itself is a pair of binary searches. Sorting also groups the
+    # non-finite values at the ends (-inf first; +inf, then NaN last), so
+    # they are excluded by the initial window without an isfinite pass.
+    s = np.sort(np.asarray(arr, dtype=dtype), axis=None)
+    lo = int(np.searchsorted(s, -np.inf, side="right"))
+    hi = int(np.searchsorted(s, np.inf, side="left"))
+    if hi <= lo:
+        return 0.0, 1.0
     for _ in range(maxiters):
-        med = float(np.median(clipped))
-        mad = float(np.median(np.abs(clipped - med)))
-        rms = 1.4826 * mad
+        med = _sorted_median(s, lo, hi)
+        rms = 1.4826 * _sorted_mad(s, lo, hi, med)
         if not np.isfinite(rms) or rms <= 0:
             break
-        keep = np.abs(clipped - med) <= sigma * rms
-        if keep.all() or keep.sum() == 0:
+        new_lo = max(lo, int(np.searchsorted(s, med - sigma * rms, side="left")))
+        new_hi = min(hi, int(np.searchsorted(s, med + sigma * rms, side="right")))
+        if (new_lo == lo and new_hi == hi) or new_hi <= new_lo:
             break
-        clipped = clipped[keep]
+        lo, hi = new_lo, new_hi
 
-    bg = float(np.median(clipped))
-    mad = float(np.median(np.abs(clipped - bg)))
-    rms = 1.4826 * mad
+    bg = _sorted_median(s, lo, hi)
+    rms = 1.4826 * _sorted_mad(s, lo, hi, bg)
     if not np.isfinite(rms) or rms <= 0:
-        rms = float(np.std(clipped))
+        rms = float(np.std(s[lo:hi]))
     if not np.isfinite(rms) or rms <= 0:
         rms = 1.0
     return bg, rms
 
 
+def _sorted_median(s: np.ndarray, lo: int, hi: int) -> float:
+    """Median of the sorted window ``s[lo:hi]``."""
+    n = hi - lo
+    mid = lo + n // 2
+    if n % 2:
+        return float(s[mid])
+    return 0.5 * (float(s[mid - 1]) + float(s[mid]))
+
+
+def _sorted_mad(s: np.ndarray, lo: int, hi: int, med: float) -> float:
+    """Median of ``|s[lo:hi] - med|`` for a sorted window, in O(log n).
+
+    Distances below and above ``med`` form two sorted sequences, so each
+    order statistic is found by a k-th-of-two-sorted-arrays search.
+    """
+    p = min(max(int(np.searchsorted(s, med)), lo), hi)
+    n = hi - lo
+    k = n // 2
+    if n % 2:
+        return _kth_abs_deviation(s, lo, p, hi, med, k)
+    return 0.5 * (_kth_abs_deviation(s, lo, p, hi, med, k - 1) + _kth_abs_deviation(s, lo, p, hi, med, k))
+
+
+def _kth_abs_deviation(s: np.ndarray, lo: int, p: int, hi: int, med: float, k: int) -> float:
+    # below[i] = med - s[p - 1 - i] (i < p - lo), above[j] = s[p + j] - med
+    # (j < hi - p); both ascending. Take i from below and k + 1 - i from above.
+    n_below = p - lo
+    n_above = hi - p
+    take = k + 1
+    i_lo = max(0, take - n_above)
+    i_hi = min(take, n_below)
+    while True:
+        i = (i_lo + i_hi) // 2
+        j = take - i
+        if i > 0 and j < n_above and med - float(s[p - i]) > float(s[p + j]) - med:
+            i_hi = i - 1
+        elif j > 0 and i < n_below and float(s[p + j - 1]) - med > med - float(s[p - 1 - i]):
+            i_lo = i + 1
+        else:
+            last_below = med - float(s[p - i]) if i > 0 else -math.inf
+            last_above = float(s[p + j - 1]) - med if j > 0 else -math.inf
+            return max(last_below, last_above)
+
+
 def _extract_image_array(obj: Any) -> np.ndarray:
     if isinstance(obj, np.ndarray):
         return obj
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+
 import pytest
 from astropy.time import Time
 import numpy as np
@@ -351,3 +353,44 @@ def test_find_visit_detector_length_mismatch_raises():
     svc = nt.cutouts_from_butler("dp1", collections="test", butler=butler)
     with pytest.raises(ValueError):
         svc.find_visit_detector(ra=[53.0, 53.1], dec=[-27.9], t=["2024-01-01T00:00:30", "2024-01-01T00:00:40", "2024-01-01T00:00:50"])
+
+
+def test_visit_detector_cutout_prefetch_preserves_order():
+    from neandertools.butler import cutouts_from_butler
+
+    class PerVisitButler(FakeButler):
+        def get(self, dataset_type, dataId=None):
+            self.calls.append((dataset_type, dataId))
+            # Earlier visits take longer, so reads finish out of order.
+            time.sleep(0.01 * (130 - dataId["visit"]))
+            return FakeImage(array=np.full((101, 101), dataId["visit"], dtype=np.float32))
+
+    butler = PerVisitButler()
+    svc = cutouts_from_butler("dp1", collections="test", butler=butler)
+    visits = [125, 123, 127, 124]
+
+    out = svc.cutout(visit=visits, detector=9, x=50, y=50, h=5, w=5, ncores=1, prefetch=3)
+
+    assert [int(o.getArray()[0, 0]) for o in out] == visits
+    assert all(o.getArray().shape == (5, 5) for o in out)
+
+    with pytest.raises(ValueError, match="ncores=1"):
+        svc.cutout(visit=visits, detector=9, x=50, y=50, h=5, w=5, prefetch=3)
+
+
+def test_get_exposures_prefetched_yields_in_input_order():
+    from neandertools.butler import get_exposures_prefetched
+
+    class SlowFirstButler:
+        def get(self, dataset_type, dataId=None):
+            if dataId["visit"] == 0:
+                time.sleep(0.05)
+            return (dataset_type, dataId["visit"])
+
+    data_ids = [{"visit": v, "detector": 0} for v in range(5)]
+    out = list(get_exposures_prefetched(SlowFirstButler(), "visit_image", data_ids, prefetch=3))
+
+    assert out == [("visit_image", v) for v in range(5)]
+
+    with pytest.raises(ValueError):
+        list(get_exposures_prefetched(SlowFirstButler(), "visit_image", data_ids, prefetch=0))
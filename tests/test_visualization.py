@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from neandertools import visualization as viz
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    yield
+    plt.close("all")
+
+
+def _prepare(arrays, **kwargs):
+    params = dict(
+        qmin=0.0,
+        qmax=0.99,
+        match_background=True,
+        match_noise=False,
+        sigma_clip=3.0,
+        sigma_clip_iters=5,
+        warp_common_grid=False,
+        warp_shape=None,
+        warp_pixel_scale_arcsec=None,
+        auto_vlims=False,
+        contrast=0.1,
+    )
+    params.update(kwargs)
+    return viz._prepare_cutouts_for_display(images=arrays, **params)
+
+
+def _with_nonfinite(arrays, fill):
+    out = []
+    for i, arr in enumerate(arrays):
+        arr = arr.copy()
+        arr[i, 0] = np.nan
+        arr[i, 1] = -np.inf
+        arr[i, 2] = np.inf
+        arr[i + 5, :] = fill
+        out.append(arr)
+    return out
+
+
+@pytest.mark.parametrize("match_noise", [False, True])
+@pytest.mark.parametrize("auto_vlims", [False, True])
+def test_shared_limits_ignore_infinite_pixels(match_noise, auto_vlims):
+    rng = np.random.default_rng(0)
+    arrays = [rng.normal(10.0, 2.0, (20, 20)).astype(np.float32) for _ in range(3)]
+    with_inf = _with_nonfinite(arrays, np.inf)
+    with_nan = [np.where(np.isfinite(arr), arr, np.nan) for arr in with_inf]
+
+    _, vmins, vmaxs, _, _ = _prepare(with_inf, match_noise=match_noise, auto_vlims=auto_vlims)
+    _, ref_vmins, ref_vmaxs, _, _ = _prepare(with_nan, match_noise=match_noise, auto_vlims=auto_vlims)
+
+    assert np.all(np.isfinite(vmins)) and np.all(np.isfinite(vmaxs))
+    assert vmins == ref_vmins
+    assert vmaxs == ref_vmaxs
+
+
+def test_shared_limits_ignore_infinite_pixels_mixed_shapes():
+    rng = np.random.default_rng(2)
+    arrays = [rng.normal(10.0, 2.0, (20, 20 + i)) for i in range(3)]
+    with_inf = _with_nonfinite(arrays, -np.inf)
+    finite = np.concatenate([arr[np.isfinite(arr)] for arr in _prepare(with_inf)[0]])
+
+    _, vmins, vmaxs, _, _ = _prepare(with_inf, qmin=0.0, qmax=0.9)
+
+    np.testing.assert_allclose(vmins, [np.quantile(finite, 0.0)] * 3, rtol=1e-6)
+    np.testing.assert_allclose(vmaxs, [np.quantile(finite, 0.9)] * 3, rtol=1e-6)
+
+
+def test_shared_limits_keep_infinite_pixels_in_output():
+    rng = np.random.default_rng(1)
+    arrays = _with_nonfinite([rng.normal(0.0, 1.0, (20, 20)) for _ in range(3)], -np.inf)
+
+    proc, _, _, _, _ = _prepare(arrays)
+
+    for arr, out in zip(arrays, proc):
+        np.testing.assert_array_equal(np.isposinf(out), np.isposinf(arr))
+        np.testing.assert_array_equal(np.isneginf(out), np.isneginf(arr))
+        np.testing.assert_array_equal(np.isnan(out), np.isnan(arr))
+
+
+def _gif_frames(path, mode):
+    from PIL import Image
+
+    frames = []
+    with Image.open(path) as im:
+        for i in range(im.n_frames):
+            im.seek(i)
+            frames.append(np.asarray(im.convert(mode)))
+    return frames
+
+
+def test_cutouts_gif_grayscale_frames_are_lossless(tmp_path, monkeypatch):
+    rendered = []
+    append = viz._GifStream.append
+
+    def recording_append(self, frame):
+        rendered.append(np.asarray(frame.convert("L")))
+        append(self, frame)
+
+    monkeypatch.setattr(viz._GifStream, "append", recording_append)
+    rng = np.random.default_rng(3)
+    arrays = [rng.normal(0.0, 1.0, (40, 40)) for _ in range(6)]
+
+    path = viz.cutouts_gif(arrays, tmp_path / "gray.gif", cmap="gray")
+
+    decoded = _gif_frames(path, "L")
+    assert len(decoded) == len(rendered) == 6
+    for want, got in zip(rendered, decoded):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_cutouts_gif_keeps_ne_indicator_colors_with_gray_cmap(tmp_path):
+    rng = np.random.default_rng(3)
+    arrays = [rng.normal(0.0, 1.0, (40, 40)) for _ in range(3)]
+
+    path = viz.cutouts_gif(arrays, tmp_path / "ne.gif", cmap="gray", show_ne_indicator=True)
+
+    for frame in _gif_frames(path, "RGB"):
+        r, g, b = (frame[..., k].astype(int) for k in range(3))
+        assert ((r > 150) & (g > 150) & (b < 100)).any()  # yellow East arrow
+        assert ((r < 100) & (g > 150) & (b > 150)).any()  # cyan North arrow
+
+
+def test_gif_stream_mixes_gray_and_color_frames(tmp_path):
+    from PIL import Image
+
+    rng = np.random.default_rng(4)
+    gray = rng.integers(0, 256, (16, 16), dtype=np.uint8)
+    color = np.zeros((16, 16, 3), dtype=np.uint8)
+    color[:8] = (255, 0, 0)
+    color[8:] = (0, 0, 255)
+
+    with viz._GifStream(tmp_path / "mixed.gif", duration_ms=100) as gif:
+        gif.append(Image.fromarray(color, "RGB"))
+        gif.append(Image.fromarray(np.stack([gray] * 3, axis=-1), "RGB"))
+        gif.append(Image.fromarray(gray, "L"))
+        gif.append(Image.fromarray(color[::-1], "RGB"))
+
+    frames = _gif_frames(tmp_path / "mixed.gif", "RGB")
+    np.testing.assert_array_equal(frames[0], color)
+    np.testing.assert_array_equal(frames[1], np.stack([gray] * 3, axis=-1))
+    np.testing.assert_array_equal(frames[2], np.stack([gray] * 3, axis=-1))
+    np.testing.assert_array_equal(frames[3], color[::-1])
+
+
+def test_grid_renderer_clears_titles_when_batch_has_none():
+    rng = np.random.default_rng(5)
+    renderer = viz.GridRenderer(3, ncols=2)
+    viz.cutouts_grid([rng.normal(size=(10, 10)) for _ in range(3)], titles=["A", "B", "C"], renderer=renderer)
+    assert renderer.axes[0][0].get_title() == "A"
+
+    viz.cutouts_grid([rng.normal(size=(10, 10)) for _ in range(3)], renderer=renderer)
+
+    assert [renderer.axes[i // 2][i % 2].get_title() for i in range(3)] == ["", "", ""]
+
+
+def test_grid_renderer_ignores_extra_titles():
+    rng = np.random.default_rng(7)
+    renderer = viz.GridRenderer(3, ncols=2)
+
+    viz.cutouts_grid([rng.normal(size=(10, 10)) for _ in range(3)], titles=list("ABCDEF"), renderer=renderer)
+
+    assert [renderer.axes[i // 2][i % 2].get_title() for i in range(3)] == ["A", "B", "C"]
+    assert renderer.axes[1][1].get_title() == ""
+
+
+def _reference_bg_rms(arr, sigma, maxiters):
+    values = np.asarray(arr, dtype=np.float64).ravel()
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        return 0.0, 1.0
+
+    clipped = values
+    for _ in range(maxiters):
+        med = np.median(clipped)
+        rms = 1.4826 * np.median(np.abs(clipped - med))
+        if rms <= 0:
+            break
+        keep = np.abs(clipped - med) <= sigma * rms
+        if keep.all() or not keep.any():
+            break
+        clipped = clipped[keep]
+
+    bg = np.median(clipped)
+    rms = 1.4826 * np.median(np.abs(clipped - bg))
+    if rms <= 0:
+        rms = np.std(clipped)
+    if rms <= 0:
+        rms = 1.0
+    return float(bg), float(rms)
+
+
+def _random_background(rng, dtype):
+    n = int(rng.integers(1, 400))
+    values = rng.normal(rng.uniform(-50, 50), rng.uniform(0.5, 20), n)
+    values[rng.random(n) < 0.1] += rng.uniform(50, 500)  # sources
+    if rng.random() < 0.5:
+        values = np.round(values / rng.choice([1.0, 5.0]))  # ties
+    if np.issubdtype(dtype, np.floating):
+        values[rng.random(n) < 0.05] = np.nan
+        values[rng.random(n) < 0.03] = np.inf
+        values[rng.random(n) < 0.03] = -np.inf
+    return values.astype(dtype)
+
+
+@pytest.mark.parametrize("dtype", [np.int16, np.float32, np.float64])
+def test_sigma_clipped_bg_rms_matches_reference(dtype):
+    rng = np.random.default_rng(8)
+    for _ in range(500):
+        values = _random_background(rng, dtype)
+        sigma = float(rng.choice([1.5, 2.0, 3.0]))
+        maxiters = int(rng.integers(1, 8))
+        shape = (1, values.size) if rng.random() < 0.5 else (values.size,)
+
+        got = viz._sigma_clipped_bg_rms(values.reshape(shape), sigma=sigma, maxiters=maxiters)
+        want = _reference_bg_rms(values.astype(np.float32) if dtype == np.float32 else values, sigma, maxiters)
+
+        np.testing.assert_allclose(got, want, rtol=1e-5, atol=1e-5)
+
+
+def test_sigma_clipped_bg_rms_without_finite_pixels():
+    values = np.array([[np.nan, np.inf], [-np.inf, np.nan]])
+
+    assert viz._sigma_clipped_bg_rms(values, sigma=3.0, maxiters=5) == (0.0, 1.0)
+
+
+def test_scale_to_uint8_maps_non_finite_pixels_to_zero():
+    arr = np.array([[0.0, 127.5, 255.0], [np.nan, np.inf, -np.inf]])
+
+    out = viz._scale_to_uint8(arr, 0.0, 255.0)
+
+    np.testing.assert_array_equal(out, [[0, 127, 255], [0, 0, 0]])
+
+
+def test_arrays_to_gif_writes_decodable_frames(tmp_path):
+    from PIL import Image
+
+    arrays = [np.arange(48, dtype=np.float64).reshape(6, 8) * 5 + i for i in range(4)]
+
+    path = viz.arrays_to_gif(arrays, tmp_path / "frames.gif", vmin=0.0, vmax=255.0, frame_duration_ms=120)
+
+    with Image.open(path) as im:
+        assert im.n_frames == 4
+        assert im.info["duration"] == 120
+        assert im.info["loop"] == 0
+    frames = _gif_frames(path, "L")
+    for arr, frame in zip(arrays, frames):
+        # Row 0 is the bottom of the cutout and the last row of the image.
+        np.testing.assert_array_equal(frame, arr[::-1].astype(np.uint8))
+
+
+def test_arrays_to_gif_rejects_mixed_shapes(tmp_path):
+    with pytest.raises(ValueError, match="identical shape"):
+        viz.arrays_to_gif([np.zeros((4, 4)), np.zeros((4, 5))], tmp_path / "bad.gif")
+
+
+def test_cutout_to_png_orientation_and_nan(tmp_path):
+    from PIL import Image
+
+    arr = np.array([[0.0, 100.0, np.nan], [200.0, 255.0, np.inf]])
+
+    path = viz.cutout_to_png(arr, tmp_path / "cutout.png", vmin=0.0, vmax=255.0)
+
+    with Image.open(path) as im:
+        assert im.mode == "L"
+        np.testing.assert_array_equal(np.asarray(im), [[200, 255, 0], [0, 100, 0]])
+
+
+def test_cutout_to_png_title_adds_strip(tmp_path):
+    from PIL import Image
+
+    arr = np.full((20, 30), 255.0)
+
+    path = viz.cutout_to_png(arr, tmp_path / "titled.png", vmin=0.0, vmax=255.0, title="frame 1")
+
+    with Image.open(path) as im:
+        pixels = np.asarray(im)
+    assert pixels.shape[0] > 20 and pixels.shape[1] == 30
+    np.testing.assert_array_equal(pixels[-20:], 255)
+    assert (pixels[:-20] < 255).any()
+
+
+def test_png_renderer_reuse_matches_single_renders(tmp_path):
+    from PIL import Image
+
+    rng = np.random.default_rng(9)
+    arrays = [rng.normal(size=(12, 16)) for _ in range(4)]
+    titles = ["first", None, "third", None]
+    renderer = viz.PngRenderer((12, 16))
+
+    for i, (arr, title) in enumerate(zip(arrays, titles)):
+        reused = renderer.render(arr, tmp_path / f"reused_{i}.png", vmin=-2.0, vmax=2.0, title=title)
+        single = viz.cutout_to_png(arr, tmp_path / f"single_{i}.png", vmin=-2.0, vmax=2.0, title=title)
+        with Image.open(reused) as a, Image.open(single) as b:
+            np.testing.assert_array_equal(np.asarray(a), np.asarray(b))
+
+    with pytest.raises(ValueError, match="expects shape"):
+        renderer.render(np.zeros((3, 3)), tmp_path / "wrong.png", vmin=0.0, vmax=1.0)
+
+
+def test_render_png_batch_parallel_matches_serial(tmp_path):
+    rng = np.random.default_rng(10)
+    arrays = [rng.normal(size=(16, 16)) for _ in range(6)]
+    titles = [f"frame {i}" for i in range(6)]
+
+    serial = viz.render_png_batch(arrays, tmp_path / "serial", titles=titles, ncores=1)
+    parallel = viz.render_png_batch(arrays, tmp_path / "parallel", titles=titles, ncores=2)
+
+    assert [p.name for p in serial] == [f"cutout_{i:04d}.png" for i in range(6)]
+    assert [p.name for p in parallel] == [p.name for p in serial]
+    for a, b in zip(serial, parallel):
+        assert a.read_bytes() == b.read_bytes()
+
+
+def test_grid_renderer_reuse_matches_fresh_render():
+    rng = np.random.default_rng(11)
+    first = [rng.normal(size=(20, 20)) for _ in range(4)]
+    second = [rng.normal(5.0, 3.0, size=(20, 20)) for _ in range(4)]
+    titles = ["a", "b", "c", "d"]
+
+    renderer = viz.GridRenderer(4, ncols=3)
+    viz.cutouts_grid(first, titles=["w", "x", "y", "z"], renderer=renderer)
+    viz.cutouts_grid(second, titles=titles, renderer=renderer)
+    reused = renderer.fig
+    fresh, _ = viz.cutouts_grid(second, ncols=3, titles=titles)
+
+    reused.canvas.draw()
+    fresh.canvas.draw()
+    np.testing.assert_array_equal(np.asarray(reused.canvas.buffer_rgba()), np.asarray(fresh.canvas.buffer_rgba()))
+
+
+def test_cutouts_mp4_requires_ffmpeg(tmp_path, monkeypatch):
+    from matplotlib.animation import FFMpegWriter
+
+    monkeypatch.setattr(FFMpegWriter, "isAvailable", classmethod(lambda cls: False))
+
+    with pytest.raises(RuntimeError, match="ffmpeg"):
+        viz.cutouts_mp4([np.zeros((8, 8))], tmp_path / "cutouts.mp4")
+
+
+def test_cutouts_mp4_writes_movie(tmp_path):
+    from matplotlib.animation import FFMpegWriter
+
+    if not FFMpegWriter.isAvailable():
+        pytest.skip("ffmpeg is not available")
+    rng = np.random.default_rng(12)
+
+    path = viz.cutouts_mp4([rng.normal(size=(20, 20)) for _ in range(3)], tmp_path / "cutouts.mp4", fps=5)
+
+    assert path.exists() and path.stat().st_size > 0
+
+
+def test_arrays_to_gif_accepts_non_contiguous_arrays(tmp_path):
+    arrays = [np.tile(np.arange(8, dtype=np.float64) * 30 + i, (6, 1)).T for i in range(2)]
+    assert not arrays[0].flags.c_contiguous
+
+    path = viz.arrays_to_gif(arrays, tmp_path / "transposed.gif", vmin=0.0, vmax=255.0)
+
+    for arr, frame in zip(arrays, _gif_frames(path, "L")):
+        np.testing.assert_array_equal(frame, arr[::-1].astype(np.uint8))
+
+
+def test_streaming_gif_writer_falls_back_without_agg_canvas(tmp_path):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.backends.backend_svg import FigureCanvasSVG
+    from matplotlib.figure import Figure
+
+    frames = {}
+    for name, canvas_cls in (("agg", FigureCanvasAgg), ("svg", FigureCanvasSVG)):
+        fig = Figure(figsize=(2, 2), dpi=50)
+        canvas_cls(fig)
+        fig.add_subplot().imshow(np.arange(16.0).reshape(4, 4), cmap="gray")
+        writer = viz._StreamingGifWriter(fps=5)
+        with writer.saving(fig, tmp_path / f"{name}.gif", dpi=fig.dpi):
+            writer.grab_frame()
+        frames[name] = _gif_frames(tmp_path / f"{name}.gif", "L")
+
+    assert not hasattr(FigureCanvasSVG(Figure()), "buffer_rgba")
+    assert len(frames["svg"]) == 1
+    np.testing.assert_array_equal(frames["svg"][0], frames["agg"][0])
+
+
+def test_render_png_batch_serial_is_thread_safe(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    rng = np.random.default_rng(13)
+    batches = [[rng.normal(size=(32, 32)) for _ in range(20)] for _ in range(4)]
+
+    def render(i, name):
+        return viz.render_png_batch(batches[i], tmp_path / f"{name}{i}", vmin=-2.0, vmax=2.0, ncores=1)
+
+    expected = [render(i, "serial") for i in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        results = list(ex.map(render, range(4), ["thread"] * 4))
+
+    for want, got in zip(expected, results):
+        assert [p.read_bytes() for p in got] == [p.read_bytes() for p in want]